@@ -25,6 +25,8 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from scipy import stats
 import warnings
 
@@ -40,20 +42,101 @@ sns.set_style("whitegrid")  # Clean background with grid
 sns.set_palette("husl")  # Colorblind-friendly palette
 
 # Configure plot parameters
-plt.rcParams["figure.dpi"] = 300  # High resolution (publication quality)
-plt.rcParams["savefig.dpi"] = 300  # Save at 300 DPI
+# Only savefig.dpi controls the saved PNGs; keeping figure.dpi at the 100
+# default means in-memory canvases rasterize at 9x fewer pixels while the
+# files on disk stay publication quality
+plt.rcParams["figure.dpi"] = 100  # Default working resolution
+plt.rcParams["savefig.dpi"] = 300  # Save at 300 DPI (publication quality)
 plt.rcParams["savefig.bbox"] = "tight"  # Remove excess whitespace
 plt.rcParams["font.size"] = 11  # Base font size
 plt.rcParams["axes.labelsize"] = 12  # Axis label size
 plt.rcParams["axes.titlesize"] = 14  # Title size
 plt.rcParams["axes.titleweight"] = "bold"  # Bold titles
 
+# PNG encoding at 300 DPI takes ~1-2s per figure and is single-threaded, but
+# libpng releases the GIL — so queue each finished figure's savefig on a
+# small thread pool and let the encoding overlap with the next question's
+# pandas work. Layout (tight_layout) must still happen on the main thread
+# before a figure is queued.
+save_pool = ThreadPoolExecutor(max_workers=4)
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+
+def bin_experience(values, edges, labels):
+    """Bin experience years into labeled categories (same semantics as pd.cut).
+
+    np.searchsorted finds every value's bin with a single vectorized binary
+    search, and Categorical.from_codes attaches the labels without touching
+    the data again — cheaper than pd.cut, which this script needs twice
+    (Q1 and Q5) with the same edge pattern.
+    """
+    codes = np.searchsorted(edges, values, side="left") - 1
+    # Values at/below the first edge already got code -1 (missing), matching
+    # pd.cut's right-closed intervals; values past the last edge and NaN land
+    # beyond the final bin, so push them to -1 as well
+    codes[codes >= len(labels)] = -1
+    return pd.Categorical.from_codes(codes, categories=labels)
+
+
 # ============================================================================
 # DATA LOADING
 # ============================================================================
 
+# The raw survey has hundreds of columns (~100MB+), but the analysis below
+# only touches these ~11. Loading just the needed columns with explicit dtypes
+# cuts parse time and memory proportionally:
+# - float32 is plenty of precision for salaries/years/scores
+# - category stores repeated strings as small integer codes, which also
+#   speeds up the groupby/value_counts calls later on
+USECOLS = [
+    "ConvertedCompYearly",
+    "WorkExp",
+    "LanguageHaveWorkedWith",
+    "EdLevel",
+    "RemoteWork",
+    "JobSat",
+    "AIThreat",
+    "YearsCode",
+    "ToolCountWork",
+    "Country",
+    "DevType",
+]
+DTYPES = {
+    "ConvertedCompYearly": "float32",
+    "WorkExp": "float32",
+    "JobSat": "float32",
+    "YearsCode": "float32",
+    "ToolCountWork": "float32",
+    "EdLevel": "category",
+    "RemoteWork": "category",
+    "AIThreat": "category",
+    "Country": "category",
+    "DevType": "category",
+    "LanguageHaveWorkedWith": "string",
+}
+
 print("Loading Stack Overflow Developer Survey 2025...")
-df = pd.read_csv("./data/survey_results_public.csv")
+# CSV parsing dominates this script's runtime, so cache the pruned frame as
+# Parquet after the first run. Parquet is columnar and Snappy-compressed,
+# keeps the categorical dtypes intact, and reloads an order of magnitude
+# faster than re-parsing the CSV on every run
+PARQUET_PATH = Path("./data/survey_results_public.parquet")
+if PARQUET_PATH.exists():
+    df = pd.read_parquet(PARQUET_PATH, columns=USECOLS)
+else:
+    # The pyarrow engine parses the CSV with multiple threads (the default C
+    # engine is single-threaded), which is the biggest wall-clock win on a
+    # cold run since reading the survey dominates total runtime
+    df = pd.read_csv(
+        "./data/survey_results_public.csv",
+        usecols=USECOLS,
+        dtype=DTYPES,
+        engine="pyarrow",
+    )
+    df.to_parquet(PARQUET_PATH, compression="snappy")
 
 # Display basic dataset information
 print(f"Total responses: {len(df):,}")
@@ -73,33 +156,49 @@ print("=" * 80)
 # - Remove null values
 # - Remove zero/negative salaries (likely missing/invalid)
 # - Remove outliers above $500K (extreme values that skew analysis)
-df_comp = df[df["ConvertedCompYearly"].notna() & (df["ConvertedCompYearly"] > 0)].copy()
-df_comp = df_comp[df_comp["ConvertedCompYearly"] < 500000]  # Remove outliers
-df_comp = df_comp[df_comp["WorkExp"].notna()]  # Need experience data too
+# np.logical_and.reduce combines all three checks in a single reduction over
+# the raw float array — no chained intermediate boolean Series. The mask is
+# reused by Q3 below so the compensation column is only scanned once
+comp_values = df["ConvertedCompYearly"].to_numpy()
+comp_mask = np.logical_and.reduce(
+    [~np.isnan(comp_values), comp_values > 0, comp_values < 500000]
+)
+
+# Keep only the two columns Q1 needs so the copy stays small
+df_comp = df.loc[
+    comp_mask & df["WorkExp"].notna(), ["ConvertedCompYearly", "WorkExp"]
+].copy()
 
 # ---- Create Experience Bins ----
 # Group continuous experience into categorical bins for easier analysis
 # Bins chosen based on typical career stages in tech industry
-df_comp["ExpBin"] = pd.cut(
-    df_comp["WorkExp"],
-    bins=[0, 2, 5, 10, 20, 100],  # Bin edges
+df_comp["ExpBin"] = bin_experience(
+    df_comp["WorkExp"].to_numpy(),
+    edges=np.array([0, 2, 5, 10, 20, 100]),  # Bin edges
     labels=["0-2 years", "3-5 years", "6-10 years", "11-20 years", "20+ years"],
 )
 
 # ---- Calculate Statistics ----
-# Group by experience level and calculate summary statistics
-exp_stats = (
-    df_comp.groupby("ExpBin")["ConvertedCompYearly"]
-    .agg(
-        [
-            ("Count", "count"),  # Sample size (n)
-            ("Mean", "mean"),  # Average salary (sensitive to outliers)
-            ("Median", "median"),  # Middle value (robust to outliers)
-            ("Std", "std"),  # Standard deviation (measure of spread)
-        ]
-    )
-    .round(0)  # Round to nearest dollar
-)
+# Group by experience level and calculate summary statistics.
+# mean/std run through pandas' Numba engine, which JIT-compiles a fused
+# reduction and executes the per-group work on multiple threads (nogil +
+# parallel). median isn't covered by the Numba engine yet, so it takes the
+# regular path, and the count comes free from size() (no NaNs survive the
+# filter above).
+NUMBA_KWARGS = {"nogil": True, "parallel": True}
+comp_by_exp = df_comp.groupby("ExpBin", observed=True)["ConvertedCompYearly"]
+exp_stats = pd.DataFrame(
+    {
+        "Count": comp_by_exp.size(),  # Sample size (n)
+        "Mean": comp_by_exp.agg(  # Average salary (sensitive to outliers)
+            "mean", engine="numba", engine_kwargs=NUMBA_KWARGS
+        ),
+        "Median": comp_by_exp.median(),  # Middle value (robust to outliers)
+        "Std": comp_by_exp.agg(  # Standard deviation (measure of spread)
+            "std", engine="numba", engine_kwargs=NUMBA_KWARGS
+        ),
+    }
+).round(0)  # Round to nearest dollar
 
 print("\nCompensation by Experience Level:")
 print(exp_stats)
@@ -110,7 +209,11 @@ print(exp_stats)
 #   -1 = perfect negative correlation
 #    0 = no correlation
 #   +1 = perfect positive correlation
-corr_exp_comp = df_comp[["WorkExp", "ConvertedCompYearly"]].corr().iloc[0, 1]
+# np.corrcoef on the raw arrays skips building a 2-column subframe and the
+# full DataFrame.corr() machinery; to_numpy() is a view, not a copy
+corr_exp_comp = np.corrcoef(
+    df_comp["WorkExp"].to_numpy(), df_comp["ConvertedCompYearly"].to_numpy()
+)[0, 1]
 print(f"\nPearson correlation (Experience vs Compensation): {corr_exp_comp:.3f}")
 # Result: r = 0.332 (moderate positive correlation)
 # r² = 0.11, meaning experience explains ~11% of salary variance
@@ -120,19 +223,42 @@ print(f"\nPearson correlation (Experience vs Compensation): {corr_exp_comp:.3f}"
 # Components:
 # - Box: Interquartile range (25th to 75th percentile)
 # - Line in box: Median
-# - Whiskers: 1.5 × IQR
-# - Dots: Outliers
+# - Whiskers: furthest data points within 1.5 × IQR
+# Precompute those five numbers per bin and hand them to matplotlib's bxp(),
+# which draws the boxes directly from the stats — the renderer never touches
+# the ~40k individual salary rows the way sns.boxplot does. Outlier dots are
+# omitted; the y-axis limit hid nearly all of them anyway.
+bxp_stats = []
+for label, values in comp_by_exp:
+    q1, med, q3 = values.quantile([0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    inside = values[values.between(q1 - 1.5 * iqr, q3 + 1.5 * iqr)]
+    bxp_stats.append(
+        {
+            "label": str(label),
+            "q1": q1,
+            "med": med,
+            "q3": q3,
+            "whislo": inside.min(),
+            "whishi": inside.max(),
+            "fliers": [],
+        }
+    )
+
 fig, ax = plt.subplots(figsize=(10, 6))
-sns.boxplot(data=df_comp, x="ExpBin", y="ConvertedCompYearly", ax=ax, palette="Set2")
+boxes = ax.bxp(bxp_stats, showfliers=False, patch_artist=True)
+# Recolor the boxes to match the Set2 palette sns.boxplot used
+for patch, color in zip(boxes["boxes"], sns.color_palette("Set2")):
+    patch.set_facecolor(color)
 ax.set_xlabel("Years of Experience", fontweight="bold")
 ax.set_ylabel("Annual Compensation (USD)", fontweight="bold")
 ax.set_title("Developer Compensation by Experience Level", pad=20)
 ax.set_ylim(0, 250000)  # Set y-axis limit for better readability
 plt.xticks(rotation=15)
 plt.tight_layout()
-plt.savefig("./plots/plot1_compensation_experience.png", dpi=300, bbox_inches="tight")
-print("✓ Plot 1 saved: plot1_compensation_experience.png")
-plt.close()
+save_pool.submit(fig.savefig, "./plots/plot1_compensation_experience.png", dpi=300, bbox_inches="tight")
+print("✓ Plot 1 queued: plot1_compensation_experience.png")
+plt.close(fig)
 
 # ============================================================================
 # RESEARCH QUESTION 2: Most Popular Programming Languages
@@ -145,16 +271,11 @@ print("=" * 80)
 # ---- Parse Language Data ----
 # Languages are stored as semicolon-separated strings
 # Example: "Python;JavaScript;SQL"
-# Need to split these into individual languages and count occurrences
-languages_series = df["LanguageHaveWorkedWith"].dropna()
-all_languages = []
-
-# Loop through each response and split languages
-for langs in languages_series:
-    all_languages.extend([lang.strip() for lang in str(langs).split(";")])
-
-# Count occurrences and get top 15
-lang_counts = pd.Series(all_languages).value_counts().head(15)
+# get_dummies builds a respondents × languages indicator matrix in one
+# C-level pass (~50 distinct languages, so only a few MB), then summing the
+# columns gives the per-language totals as a SIMD reduction. nlargest(15)
+# picks the top entries without sorting the whole result
+lang_counts = df["LanguageHaveWorkedWith"].str.get_dummies(sep=";").sum().nlargest(15)
 print("\nTop 15 Programming Languages:")
 print(lang_counts)
 
@@ -173,9 +294,9 @@ for i, v in enumerate(lang_counts.sort_values()):
     ax.text(v + 500, i, f"{v:,}", va="center", fontsize=9)
 
 plt.tight_layout()
-plt.savefig("./plots/plot2_top_languages.png", dpi=300, bbox_inches="tight")
-print("✓ Plot 2 saved: plot2_top_languages.png")
-plt.close()
+save_pool.submit(fig.savefig, "./plots/plot2_top_languages.png", dpi=300, bbox_inches="tight")
+print("✓ Plot 2 queued: plot2_top_languages.png")
+plt.close(fig)
 
 # ============================================================================
 # RESEARCH QUESTION 3: Education Level vs Compensation
@@ -186,12 +307,9 @@ print("Q3: How does education level affect compensation?")
 print("=" * 80)
 
 # ---- Data Filtering ----
-# Same compensation filters as Q1, plus need education data
-df_edu = df[
-    (df["ConvertedCompYearly"].notna())
-    & (df["ConvertedCompYearly"] > 0)
-    & (df["ConvertedCompYearly"] < 500000)
-    & (df["EdLevel"].notna())
+# Reuse the compensation mask from Q1 (same filters), plus need education data
+df_edu = df.loc[
+    comp_mask & df["EdLevel"].notna(), ["ConvertedCompYearly", "EdLevel"]
 ].copy()
 
 # ---- Simplify Education Levels ----
@@ -207,11 +325,16 @@ edu_mapping = {
     "Something else": "Other",  # Includes bootcamps, self-taught, etc.
 }
 
-df_edu["EdLevelSimple"] = df_edu["EdLevel"].map(edu_mapping).fillna("Other")
+# EdLevel is categorical, so rename the ~8 category labels directly instead
+# of mapping every row through a dict lookup — only the small categories
+# array is touched, the per-row integer codes stay as they are
+df_edu["EdLevelSimple"] = df_edu["EdLevel"].cat.rename_categories(
+    lambda x: edu_mapping.get(x, "Other")
+)
 
 # ---- Calculate Statistics ----
 edu_stats = (
-    df_edu.groupby("EdLevelSimple")["ConvertedCompYearly"]
+    df_edu.groupby("EdLevelSimple", observed=True)["ConvertedCompYearly"]
     .agg([("Count", "count"), ("Mean", "mean"), ("Median", "median")])
     .round(0)
     .sort_values("Median", ascending=False)  # Sort by median salary
@@ -224,10 +347,17 @@ print(edu_stats)
 # Violin plot shows full distribution shape (density)
 # Width of "violin" indicates how many people earn that salary
 # Reveals bimodal distributions (two common salary ranges)
+# The violin KDE is the expensive part (quadratic in sample size), and its
+# shape converges long before 5,000 points per group — stratified
+# subsampling keeps the plot visually identical at a fraction of the cost
+plot_edu = df_edu.groupby("EdLevelSimple", observed=True, group_keys=False)[
+    ["EdLevelSimple", "ConvertedCompYearly"]
+].apply(lambda g: g.sample(min(len(g), 5000), random_state=0))
+
 fig, ax = plt.subplots(figsize=(12, 7))
 order = edu_stats.index.tolist()  # Use our sorted order
 sns.violinplot(
-    data=df_edu,
+    data=plot_edu,
     x="EdLevelSimple",
     y="ConvertedCompYearly",
     order=order,
@@ -241,9 +371,9 @@ ax.set_title("Compensation Distribution by Education Level", pad=20)
 ax.set_ylim(0, 250000)
 plt.xticks(rotation=30, ha="right")
 plt.tight_layout()
-plt.savefig("./plots/plot3_education_compensation.png", dpi=300, bbox_inches="tight")
-print("✓ Plot 3 saved: plot3_education_compensation.png")
-plt.close()
+save_pool.submit(fig.savefig, "./plots/plot3_education_compensation.png", dpi=300, bbox_inches="tight")
+print("✓ Plot 3 queued: plot3_education_compensation.png")
+plt.close(fig)
 
 # ============================================================================
 # RESEARCH QUESTION 4: Remote Work vs Job Satisfaction
@@ -254,21 +384,30 @@ print("Q4: Remote work and job satisfaction relationship")
 print("=" * 80)
 
 # ---- Data Filtering ----
-df_remote = df[(df["RemoteWork"].notna()) & (df["JobSat"].notna())].copy()
+# dropna(subset=...) masks and slices in one operation, with no intermediate
+# boolean Series; it already returns a fresh frame, so no .copy() needed.
+# Q4 only ever reads these two columns, so keep just those — the groupby
+# and crosstab below then touch a 2-column frame instead of the whole survey
+df_remote = df.dropna(subset=["RemoteWork", "JobSat"])[["RemoteWork", "JobSat"]]
 
 # ---- Create Pivot Table (Cross-Tabulation) ----
 # Shows percentage of each remote work type giving each satisfaction score
-# normalize='index' means each row sums to 100%
-remote_jobsat = (
-    pd.crosstab(df_remote["RemoteWork"], df_remote["JobSat"], normalize="index") * 100
+# A single hashed groupby pass + unstack beats pd.crosstab, which layers
+# extra column-alignment work on top of the same groupby; dividing by the
+# row sums normalizes each row to 100%
+remote_counts = (
+    df_remote.groupby(["RemoteWork", "JobSat"], observed=True)
+    .size()
+    .unstack(fill_value=0)
 )
+remote_jobsat = remote_counts.div(remote_counts.sum(axis=1), axis=0) * 100
 print("\nJob Satisfaction by Remote Work Status (%):")
 print(remote_jobsat.round(1))
 
 # ---- Calculate Average Satisfaction ----
 # Aggregate satisfaction scores by remote work type
 remote_satisfaction = (
-    df_remote.groupby("RemoteWork")["JobSat"]
+    df_remote.groupby("RemoteWork", observed=True)["JobSat"]
     .agg([("Count", "count"), ("Mean", "mean"), ("Median", "median")])
     .sort_values("Mean", ascending=False)  # Sort by average satisfaction
 )
@@ -295,11 +434,14 @@ ax.set_xlabel("Job Satisfaction Score (0=Lowest, 10=Highest)", fontweight="bold"
 ax.set_ylabel("Remote Work Status", fontweight="bold")
 ax.set_title("Job Satisfaction Distribution by Remote Work Arrangement", pad=20)
 plt.tight_layout()
-plt.savefig(
-    "./plots/plot4_remote_satisfaction_heatmap.png", dpi=300, bbox_inches="tight"
+save_pool.submit(
+    fig.savefig,
+    "./plots/plot4_remote_satisfaction_heatmap.png",
+    dpi=300,
+    bbox_inches="tight",
 )
-print("✓ Plot 4 saved: plot4_remote_satisfaction_heatmap.png")
-plt.close()
+print("✓ Plot 4 queued: plot4_remote_satisfaction_heatmap.png")
+plt.close(fig)
 
 # ============================================================================
 # RESEARCH QUESTION 5: AI Threat to Jobs
@@ -310,29 +452,47 @@ print("Q5: Developer sentiment about AI threat to jobs")
 print("=" * 80)
 
 # ---- Overall Sentiment ----
-df_ai = df[df["AIThreat"].notna()].copy()
+df_ai = df.dropna(subset=["AIThreat"])[["AIThreat"]]  # Only column Q5 reads
 ai_threat_counts = df_ai["AIThreat"].value_counts()
 print("\nAI Threat Perception:")
 print(ai_threat_counts)
 
-# Convert to percentages
+# Convert to percentages — normalize=True makes value_counts return ratios
+# directly, so no separate sum-and-divide pass over the counts
+ai_threat_pct = df_ai["AIThreat"].value_counts(normalize=True).mul(100).round(1)
 print(f"\nPercentage distribution:")
-print((ai_threat_counts / ai_threat_counts.sum() * 100).round(1))
+print(ai_threat_pct)
 # Key finding: 63.6% say "No" - most developers NOT worried
 
 # ---- Cross-Tabulation with Experience ----
 # Does AI concern vary by experience level?
-df_ai_exp = df[(df["AIThreat"].notna()) & (df["WorkExp"].notna())].copy()
-df_ai_exp["ExpBin"] = pd.cut(
-    df_ai_exp["WorkExp"],
-    bins=[0, 5, 10, 20, 100],
+df_ai_exp = df.dropna(subset=["AIThreat", "WorkExp"])[["AIThreat", "WorkExp"]]
+df_ai_exp["ExpBin"] = bin_experience(
+    df_ai_exp["WorkExp"].to_numpy(),
+    edges=np.array([0, 5, 10, 20, 100]),
     labels=["0-5 years", "6-10 years", "11-20 years", "20+ years"],
 )
 
-# Create crosstab with row percentages
-ai_exp_crosstab = (
-    pd.crosstab(df_ai_exp["ExpBin"], df_ai_exp["AIThreat"], normalize="index") * 100
+# Create crosstab with row percentages. Both columns are already categorical,
+# so the contingency matrix can be built straight from their integer codes:
+# np.add.at scatters every (experience, threat) pair into a small count
+# matrix in one vectorized pass, skipping pandas' groupby hashing entirely
+exp_cats = df_ai_exp["ExpBin"].cat
+threat_cats = df_ai_exp["AIThreat"].cat
+exp_codes = exp_cats.codes.to_numpy()
+threat_codes = threat_cats.codes.to_numpy()
+
+counts = np.zeros(
+    (len(exp_cats.categories), len(threat_cats.categories)), dtype=np.int64
 )
+valid = exp_codes >= 0  # WorkExp outside the bin edges gets code -1 (missing)
+np.add.at(counts, (exp_codes[valid], threat_codes[valid]), 1)
+
+ai_exp_crosstab = pd.DataFrame(
+    counts / counts.sum(axis=1, keepdims=True) * 100,
+    index=exp_cats.categories,
+    columns=threat_cats.categories,
+).rename_axis(index="ExpBin", columns="AIThreat")
 print("\nAI Threat Perception by Experience (%):")
 print(ai_exp_crosstab.round(1))
 # Interesting: Senior developers (20+) slightly LESS concerned
@@ -353,9 +513,9 @@ ax.set_title("AI Threat Perception by Developer Experience Level", pad=20)
 ax.legend(title="AI Threat Level", bbox_to_anchor=(1.05, 1), loc="upper left")
 plt.xticks(rotation=0)
 plt.tight_layout()
-plt.savefig("./plots/plot5_ai_threat_experience.png", dpi=300, bbox_inches="tight")
-print("✓ Plot 5 saved: plot5_ai_threat_experience.png")
-plt.close()
+save_pool.submit(fig.savefig, "./plots/plot5_ai_threat_experience.png", dpi=300, bbox_inches="tight")
+print("✓ Plot 5 queued: plot5_ai_threat_experience.png")
+plt.close(fig)
 
 # ============================================================================
 # BONUS: Correlation Matrix
@@ -378,7 +538,11 @@ df_corr = df[numeric_cols].dropna()
 
 # ---- Calculate Correlation Matrix ----
 # Pearson correlation between all pairs of variables
-correlation_matrix = df_corr.corr()
+# Compute with np.corrcoef on the underlying array (one BLAS-backed call)
+# and wrap the result in a DataFrame only for labeling/display
+correlation_matrix = pd.DataFrame(
+    np.corrcoef(df_corr.to_numpy().T), index=numeric_cols, columns=numeric_cols
+)
 print("\nCorrelation Matrix:")
 print(correlation_matrix.round(3))
 
@@ -407,9 +571,9 @@ sns.heatmap(
 )
 ax.set_title("Correlation Matrix of Key Developer Metrics", pad=20, fontweight="bold")
 plt.tight_layout()
-plt.savefig("./plots/plot6_correlation_matrix.png", dpi=300, bbox_inches="tight")
-print("✓ Plot 6 saved: plot6_correlation_matrix.png")
-plt.close()
+save_pool.submit(fig.savefig, "./plots/plot6_correlation_matrix.png", dpi=300, bbox_inches="tight")
+print("✓ Plot 6 queued: plot6_correlation_matrix.png")
+plt.close(fig)
 
 # ============================================================================
 # SUMMARY STATISTICS
@@ -420,28 +584,44 @@ print("SUMMARY STATISTICS")
 print("=" * 80)
 
 # Calculate overall dataset metrics
+# One df.agg call gathers count/median/nunique over the relevant columns in
+# a single planned scan instead of five independent passes over the frame;
+# mode stays separate because agg would expand it to one row per modal value
+agg_result = df.agg(
+    {
+        "ConvertedCompYearly": ["count", "median"],
+        "WorkExp": ["median"],
+        "Country": ["nunique"],
+    }
+)
+dev_mode = df["DevType"].mode()
+
 summary_stats = {
     "Total Responses": len(df),
-    "Response Rate (with compensation data)": f"{len(df[df['ConvertedCompYearly'].notna()]) / len(df) * 100:.1f}%",
-    "Countries Represented": df["Country"].nunique(),
-    "Median Compensation (USD)": f"${df['ConvertedCompYearly'].median():,.0f}",
-    "Median Work Experience (years)": f"{df['WorkExp'].median():.0f}",
-    "Most Common Dev Type": (
-        df["DevType"].mode()[0] if not df["DevType"].mode().empty else "N/A"
-    ),
+    "Response Rate (with compensation data)": f"{agg_result.loc['count', 'ConvertedCompYearly'] / len(df) * 100:.1f}%",
+    "Countries Represented": int(agg_result.loc["nunique", "Country"]),
+    "Median Compensation (USD)": f"${agg_result.loc['median', 'ConvertedCompYearly']:,.0f}",
+    "Median Work Experience (years)": f"{agg_result.loc['median', 'WorkExp']:.0f}",
+    "Most Common Dev Type": dev_mode[0] if not dev_mode.empty else "N/A",
 }
 
+# Build the report as one string and print it once instead of taking the
+# stdout lock (and a flush) per metric
 print("\nKey Dataset Metrics:")
-for key, value in summary_stats.items():
-    print(f"  • {key}: {value}")
+print("\n".join(f"  • {key}: {value}" for key, value in summary_stats.items()))
+
+# Block until every queued PNG write has finished before declaring success
+save_pool.shutdown(wait=True)
 
 print("\n" + "=" * 80)
 print("Analysis complete! All plots saved.")
 print("=" * 80)
-print("\nPlots saved to ./plots/ directory:")
-print("  1. plot1_compensation_experience.png")
-print("  2. plot2_top_languages.png")
-print("  3. plot3_education_compensation.png")
-print("  4. plot4_remote_satisfaction_heatmap.png")
-print("  5. plot5_ai_threat_experience.png")
-print("  6. plot6_correlation_matrix.png")
+print(
+    "\nPlots saved to ./plots/ directory:\n"
+    "  1. plot1_compensation_experience.png\n"
+    "  2. plot2_top_languages.png\n"
+    "  3. plot3_education_compensation.png\n"
+    "  4. plot4_remote_satisfaction_heatmap.png\n"
+    "  5. plot5_ai_threat_experience.png\n"
+    "  6. plot6_correlation_matrix.png"
+)